@@ -27,6 +27,8 @@ for i in range(0, 16):
     for j in range(0, 11):
         VALID_SENSORS.append("P%d.%d" % (i, j))
 
+SEND_BUFFER_SIZE = 4096
+
 VALID_FORCES = ["RHvec", "LHvec", "BMvec", "RHH", "LHH", "RHV", "LHV", "BMH", "BMV", "J", "BR",
                 "RHG", "LHG", "RHR", "LHR"]
 
@@ -40,12 +42,22 @@ class PAGIWorld(object):
     :type __message_fragment: str
     :type __task_file: str
     :type message_stack: list
+    :type __send_buffer: bytearray
+    :type __send_length: int
+    :type __flush_threshold: int
+    :type messages_sent: int
+    :type bytes_sent: int
+    :type send_calls: int
     """
-    def __init__(self, ip_address="", port=42209, timeout=3):
+    # pylint: disable=too-many-arguments
+    def __init__(self, ip_address="", port=42209, timeout=3, nodelay=True,
+                 flush_threshold=SEND_BUFFER_SIZE):
         """
 
         :param ip:
         :param port:
+        :param nodelay: set TCP_NODELAY on the socket
+        :param flush_threshold: number of buffered bytes at which messages are sent automatically
         :return:
         """
         self.pagi_socket = None
@@ -55,18 +67,27 @@ class PAGIWorld(object):
         self.__message_fragment = ""
         self.__task_file = ""
         self.message_stack = list()
-        self.connect(ip_address, port, timeout)
+        self.connect(ip_address, port, timeout, nodelay, flush_threshold)
         self.agent = PAGIAgent(self)
 
-    def connect(self, ip_address="", port=42209, timeout=3):
+    # pylint: disable=too-many-arguments
+    def connect(self, ip_address="", port=42209, timeout=3, nodelay=True,
+                flush_threshold=SEND_BUFFER_SIZE):
         """
-        Create a socket to the given
+        Create a socket to the given address. If there is already an open socket, anything left
+        in its send buffer is flushed to it first.
 
         :param ip:
         :param port:
+        :param nodelay: set TCP_NODELAY on the socket
+        :param flush_threshold: number of buffered bytes at which messages are sent automatically
         :return:
         :raises: ConnectionRefusedError
         """
+        if flush_threshold < 1:
+            raise ValueError("flush_threshold must be at least 1 byte")
+        if self.pagi_socket is not None:
+            self.flush()
         if ip_address == "":
             ip_address = socket.gethostbyname(socket.gethostname())
         self.__ip_address = ip_address
@@ -74,20 +95,68 @@ class PAGIWorld(object):
         self.__timeout = timeout
         self.__message_fragment = ""
         self.__task_file = ""
+        self.__send_buffer = bytearray(flush_threshold)
+        self.__send_length = 0
+        self.__flush_threshold = flush_threshold
         self.message_stack = list()
+        self.messages_sent = 0
+        self.bytes_sent = 0
+        self.send_calls = 0
         self.pagi_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.pagi_socket.connect((ip_address, port))
+        self.set_nodelay(nodelay)
         self.pagi_socket.setblocking(False)
         self.pagi_socket.settimeout(timeout)
 
     def disconnect(self):
         """
         Close the socket to PAGIWorld and then reset internal variables (in case we just use
-        connect directly without creating new PAGIWorld instance)
+        connect directly without creating new PAGIWorld instance). Any buffered messages are
+        sent before the socket is closed.
+
+        :return:
+        """
+        try:
+            self.flush()
+        finally:
+            self.__send_length = 0
+            self.pagi_socket.close()
 
+    def set_nodelay(self, nodelay=True):
+        """
+        Enable or disable TCP_NODELAY (Nagle's algorithm) on the socket. Since messages are
+        already coalesced in the send buffer, leaving this enabled gets each flush onto the wire
+        immediately.
+
+        :param nodelay:
+        :type nodelay: bool
         :return:
         """
-        self.pagi_socket.close()
+        self.__assert_open_socket()
+        self.pagi_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, int(bool(nodelay)))
+
+    def flush(self):
+        """
+        Send everything in the send buffer to the socket in a single sendall call. This is called
+        automatically when the buffer reaches the flush threshold and before reading any response
+        in get_message.
+
+        If sendall raises (e.g. socket.timeout), some unknown part of the buffer may already have
+        been sent, so the buffer is discarded rather than resent and the connection should not be
+        used again. Use connect() to open a new one.
+
+        :return:
+        :raises: socket.timeout, OSError
+        """
+        if self.__send_length == 0:
+            return
+        self.__assert_open_socket()
+        length = self.__send_length
+        # cleared before sending so a failed sendall never resends a partially sent buffer
+        self.__send_length = 0
+        self.pagi_socket.sendall(memoryview(self.__send_buffer)[:length])
+        self.send_calls += 1
+        self.bytes_sent += length
 
     def __assert_open_socket(self):
         """
@@ -104,6 +173,10 @@ class PAGIWorld(object):
         verify that if the message is for a sensor or action, that it's a valid sensor or action
         to prevent bad calls.
 
+        Messages are not written to the socket immediately, but are buffered until the next call
+        to get_message or flush, or until the buffer reaches the flush threshold. Commands that
+        don't wait for a reply must call flush() themselves.
+
         :param message:
         :type message: str
         :return:
@@ -128,7 +201,31 @@ class PAGIWorld(object):
         # all messages must end with \n
         if message[-1] != "\n":
             message += "\n"
-        self.pagi_socket.send(message.encode())
+        self.__buffer_message(message.encode())
+
+    def __buffer_message(self, data):
+        """
+        Append an encoded message to the send buffer, flushing first if it wouldn't fit. Messages
+        that are larger than the whole buffer are sent directly. As with flush, a failed send
+        leaves the connection unusable.
+
+        :param data:
+        :type data: bytes
+        :return:
+        """
+        length = len(data)
+        if self.__send_length + length > len(self.__send_buffer):
+            self.flush()
+        if length > len(self.__send_buffer):
+            self.pagi_socket.sendall(data)
+            self.send_calls += 1
+            self.bytes_sent += length
+        else:
+            self.__send_buffer[self.__send_length:self.__send_length + length] = data
+            self.__send_length += length
+        self.messages_sent += 1
+        if self.__send_length >= self.__flush_threshold:
+            self.flush()
 
     def get_message(self, code="", block=False):
         """
@@ -146,6 +243,7 @@ class PAGIWorld(object):
         :return:
         :raises: socket.timeout
         """
+        self.flush()
         if block:
             self.pagi_socket.setblocking(True)
         response = self.__get_message_from_stack(code)
@@ -196,6 +294,8 @@ class PAGIWorld(object):
             raise RuntimeError("Task file at '%s' was not found" % task_file)
         self.__task_file = task_file
         self.send_message("loadTask,%s" % task_file)
+        # there's no reply to loadTask, so nothing else would send the buffered message
+        self.flush()
 
     def reset_task(self):
         """
@@ -0,0 +1,140 @@
+"""
+Tests for the buffered writer in PAGIWorld, run against a loopback socket standing in for
+PAGIworld
+"""
+import os
+import socket
+import tempfile
+import unittest
+
+import pagi_api
+
+
+class PAGIWorldSendBufferTest(unittest.TestCase):
+    """
+    :type server: socket.socket
+    :type client: socket.socket
+    """
+    def setUp(self):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.client = None
+
+    def tearDown(self):
+        if self.client is not None:
+            self.client.close()
+        self.server.close()
+
+    def connect(self, flush_threshold=pagi_api.SEND_BUFFER_SIZE):
+        """
+        Create a PAGIWorld connected to the loopback server and accept its connection
+        :param flush_threshold:
+        :return: PAGIWorld
+        """
+        pagi_world = pagi_api.PAGIWorld("127.0.0.1", self.server.getsockname()[1],
+                                        flush_threshold=flush_threshold)
+        self.client, _ = self.server.accept()
+        self.client.settimeout(3)
+        return pagi_world
+
+    def receive(self, length):
+        """
+        Read exactly length bytes that the PAGIWorld sent to the server
+        :param length:
+        :return: bytes
+        """
+        data = b""
+        while len(data) < length:
+            data += self.client.recv(length - len(data))
+        return data
+
+    def assert_nothing_received(self):
+        """
+        Make sure the server hasn't been sent anything yet
+        """
+        self.client.setblocking(False)
+        try:
+            self.assertRaises(socket.error, self.client.recv, 1)
+        finally:
+            self.client.settimeout(3)
+
+    def test_messages_buffered_until_flush(self):
+        pagi_world = self.connect()
+        pagi_world.send_message("sensorRequest,BP")
+        pagi_world.send_message("sensorRequest,A")
+        self.assert_nothing_received()
+        self.assertEqual(pagi_world.messages_sent, 2)
+        self.assertEqual(pagi_world.send_calls, 0)
+        self.assertEqual(pagi_world.bytes_sent, 0)
+
+        pagi_world.flush()
+        expected = b"sensorRequest,BP\nsensorRequest,A\n"
+        self.assertEqual(self.receive(len(expected)), expected)
+        self.assertEqual(pagi_world.send_calls, 1)
+        self.assertEqual(pagi_world.bytes_sent, len(expected))
+        pagi_world.disconnect()
+
+    def test_flush_at_threshold(self):
+        # each message is 17 bytes, so the fourth doesn't fit in a 64 byte buffer
+        pagi_world = self.connect(flush_threshold=64)
+        for _ in range(4):
+            pagi_world.send_message("sensorRequest,BP")
+        self.assertEqual(self.receive(51), b"sensorRequest,BP\n" * 3)
+        self.assertEqual(pagi_world.messages_sent, 4)
+        self.assertEqual(pagi_world.send_calls, 1)
+        self.assertEqual(pagi_world.bytes_sent, 51)
+        pagi_world.disconnect()
+        self.assertEqual(self.receive(17), b"sensorRequest,BP\n")
+
+    def test_oversized_message(self):
+        pagi_world = self.connect(flush_threshold=16)
+        pagi_world.send_message("print,a")
+        text = "x" * 32
+        pagi_world.send_message("print,%s" % text)
+        expected = ("print,a\nprint,%s\n" % text).encode()
+        self.assertEqual(self.receive(len(expected)), expected)
+        self.assertEqual(pagi_world.messages_sent, 2)
+        self.assertEqual(pagi_world.send_calls, 2)
+        self.assertEqual(pagi_world.bytes_sent, len(expected))
+        pagi_world.disconnect()
+
+    def test_flush_before_read(self):
+        pagi_world = self.connect()
+        self.client.sendall(b"print,ok\n")
+        pagi_world.print_text("hi")
+        self.assertEqual(self.receive(9), b"print,hi\n")
+        self.assertEqual(pagi_world.send_calls, 1)
+        pagi_world.disconnect()
+
+    def test_load_task_flushes(self):
+        pagi_world = self.connect()
+        task_file = tempfile.NamedTemporaryFile(delete=False)
+        task_file.close()
+        try:
+            pagi_world.load_task(task_file.name)
+            expected = ("loadTask,%s\n" % task_file.name).encode()
+            self.assertEqual(self.receive(len(expected)), expected)
+            self.assertEqual(pagi_world.bytes_sent, len(expected))
+        finally:
+            os.remove(task_file.name)
+        pagi_world.disconnect()
+
+    def test_connect_flushes_old_socket(self):
+        pagi_world = self.connect()
+        pagi_world.send_message("sensorRequest,BP")
+        pagi_world.connect("127.0.0.1", self.server.getsockname()[1])
+        self.assertEqual(self.receive(17), b"sensorRequest,BP\n")
+        self.assertEqual(pagi_world.messages_sent, 0)
+        old_client = self.client
+        self.client, _ = self.server.accept()
+        old_client.close()
+        pagi_world.disconnect()
+
+    def test_invalid_flush_threshold(self):
+        self.assertRaises(ValueError, pagi_api.PAGIWorld, "127.0.0.1",
+                          self.server.getsockname()[1], flush_threshold=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()